@@ -5,12 +5,22 @@ Converts KITTI dataset (LiDAR + Camera) to MCAP format for Foxglove Studio.
 
 Usage:
     python kitti_to_mcap.py --kitti_dir /path/to/kitti --output output.mcap
+
+Library usage (lazy, one frame in memory at a time):
+    from kitti_to_mcap import iter_frames, iter_messages
+    for frame in iter_frames(Path("/path/to/kitti")):
+        ...  # frame.index, frame.timestamp_ns, frame.points, frame.image_jpeg, frame.tf
+    for msg in iter_messages(Path("/path/to/kitti")):
+        ...  # msg.topic, msg.log_time_ns, msg.data (serialized protobuf)
 """
 
 import argparse
+import math
 import os
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional
 
 import cv2
 import numpy as np
@@ -21,6 +31,18 @@ from foxglove_schemas_protobuf.FrameTransforms_pb2 import FrameTransforms
 from google.protobuf import descriptor_pb2
 
 
+LIDAR_TOPIC = "/velodyne_points"
+CAMERA_TOPIC = "/camera/image_raw"
+TF_TOPIC = "/tf"
+
+# Topic -> protobuf message type, in channel registration order
+TOPIC_SCHEMAS = {
+    LIDAR_TOPIC: PointCloud,
+    CAMERA_TOPIC: CompressedImage,
+    TF_TOPIC: FrameTransforms,
+}
+
+
 def _build_file_descriptor_set_bytes(message_descriptor) -> bytes:
     """
     Build a FileDescriptorSet (serialized) containing the given message's .proto file
@@ -226,9 +248,20 @@ def convert_pointcloud_to_proto(points: np.ndarray, timestamp_ns: int) -> PointC
     return pointcloud
 
 
-def convert_image_to_proto(image: np.ndarray, timestamp_ns: int) -> CompressedImage:
+def encode_image_jpeg(image: np.ndarray, quality: int = 90) -> bytes:
     """
-    Convert OpenCV image to Foxglove CompressedImage protobuf.
+    Compress an OpenCV image to JPEG bytes.
+    """
+    encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), int(quality)]
+    ok, img_data = cv2.imencode(".jpg", image, encode_param)
+    if not ok:
+        raise RuntimeError("cv2.imencode(.jpg) failed")
+    return img_data.tobytes()
+
+
+def convert_jpeg_to_proto(jpeg_bytes: bytes, timestamp_ns: int) -> CompressedImage:
+    """
+    Wrap already-compressed JPEG bytes in a Foxglove CompressedImage protobuf.
     """
     compressed_image = CompressedImage()
     
@@ -238,18 +271,65 @@ def convert_image_to_proto(image: np.ndarray, timestamp_ns: int) -> CompressedIm
     if hasattr(compressed_image, "frame_id"):
         compressed_image.frame_id = "camera"
     
-    # Compress image to JPEG
-    encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), 90]
-    ok, img_data = cv2.imencode(".jpg", image, encode_param)
-    if not ok:
-        raise RuntimeError("cv2.imencode(.jpg) failed")
-    
     compressed_image.format = "jpeg"
-    compressed_image.data = img_data.tobytes()
+    compressed_image.data = jpeg_bytes
     
     return compressed_image
 
 
+def convert_image_to_proto(image: np.ndarray, timestamp_ns: int) -> CompressedImage:
+    """
+    Convert OpenCV image to Foxglove CompressedImage protobuf.
+    """
+    return convert_jpeg_to_proto(encode_image_jpeg(image), timestamp_ns)
+
+
+def build_static_transforms(timestamp_ns: int, calib_dir: Optional[Path] = None) -> FrameTransforms:
+    """
+    Build the static TF tree: map -> camera (identity) and, when `calib_dir` contains
+    calib_velo_to_cam.txt, camera -> velodyne from the KITTI calibration.
+    """
+    tf_msg = FrameTransforms()
+
+    # map -> camera (identity) so Studio has a stable root frame
+    t_map_cam = tf_msg.transforms.add()
+    t_map_cam.timestamp.FromNanoseconds(timestamp_ns)
+    t_map_cam.parent_frame_id = "map"
+    t_map_cam.child_frame_id = "camera"
+    t_map_cam.translation.x = 0.0
+    t_map_cam.translation.y = 0.0
+    t_map_cam.translation.z = 0.0
+    t_map_cam.rotation.x = 0.0
+    t_map_cam.rotation.y = 0.0
+    t_map_cam.rotation.z = 0.0
+    t_map_cam.rotation.w = 1.0
+
+    # camera -> velodyne from KITTI calibration (optional but recommended)
+    if calib_dir is not None:
+        velo_to_cam_path = calib_dir / "calib_velo_to_cam.txt"
+        if velo_to_cam_path.exists():
+            R, T = _parse_kitti_r_t_calib(velo_to_cam_path)
+            qx, qy, qz, qw = _rotation_matrix_to_quaternion_xyzw(R)
+
+            # KITTI gives: p_cam = R * p_velo + T
+            # This matches a TF transform with parent=camera, child=velodyne.
+            t_cam_velo = tf_msg.transforms.add()
+            t_cam_velo.timestamp.FromNanoseconds(timestamp_ns)
+            t_cam_velo.parent_frame_id = "camera"
+            t_cam_velo.child_frame_id = "velodyne"
+            t_cam_velo.translation.x = float(T[0])
+            t_cam_velo.translation.y = float(T[1])
+            t_cam_velo.translation.z = float(T[2])
+            t_cam_velo.rotation.x = qx
+            t_cam_velo.rotation.y = qy
+            t_cam_velo.rotation.z = qz
+            t_cam_velo.rotation.w = qw
+        else:
+            print(f"Warning: calib_velo_to_cam.txt not found in calib_dir: {calib_dir}")
+
+    return tf_msg
+
+
 def find_kitti_files(kitti_dir: Path):
     """
     Find KITTI LiDAR and camera files.
@@ -282,6 +362,267 @@ def find_kitti_files(kitti_dir: Path):
     return frames
 
 
+@dataclass
+class KittiFrame:
+    """
+    One decoded KITTI frame as yielded by `iter_frames`.
+
+    `points` / `image_jpeg` / `image_shape` are None when that sensor failed to load for
+    this frame (a warning has already been printed). The transforms are static, so every
+    frame carries the same `tf` object.
+
+    `index` is the frame's position in the full drive (it drives the timestamp);
+    `position` is its position among the frames selected for this run.
+    """
+    index: int
+    position: int
+    frame_id: str
+    timestamp_ns: int
+    lidar_file: Path
+    image_file: Path
+    points: Optional[np.ndarray]
+    image_jpeg: Optional[bytes]
+    image_shape: Optional[tuple[int, ...]]
+    tf: FrameTransforms
+
+
+class KittiMessage(NamedTuple):
+    """One serialized message as yielded by `iter_messages`."""
+    topic: str
+    log_time_ns: int
+    data: bytes
+
+
+def select_frame_indices(
+    num_frames: int,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+    stride: int = 1,
+    max_frames: Optional[int] = None,
+) -> range:
+    """
+    Pick frame indices from the frame index without touching any files.
+
+    Indices are positions in `find_kitti_files` order. `start` is inclusive and `end`
+    is exclusive (like a Python slice); `max_frames` caps the result after striding.
+    """
+    if stride < 1:
+        raise ValueError(f"stride must be >= 1, got {stride}")
+    if max_frames is not None and max_frames < 1:
+        raise ValueError(f"max_frames must be >= 1, got {max_frames}")
+
+    indices = range(num_frames)[start:end:stride]
+    if max_frames is not None:
+        indices = indices[:max_frames]
+    return indices
+
+
+def _parse_frame_bound(value: str, frame_rate: float) -> int:
+    """
+    Parse a --start/--end value into a frame index.
+    Plain integers are frame indices; a trailing "s" means seconds from the first frame
+    (e.g. "12.5s"), rounded up to the first frame at or after that time.
+    """
+    value = value.strip()
+    if value.lower().endswith("s"):
+        seconds = float(value[:-1])
+        if not math.isfinite(seconds * frame_rate):
+            raise ValueError(f"expected a finite time, got {value}")
+        if seconds < 0:
+            raise ValueError(f"expected a non-negative time, got {value}")
+        # Small epsilon so e.g. 0.3s * 10 Hz doesn't round up to frame 4
+        return int(math.ceil(seconds * frame_rate - 1e-9))
+    index = int(value)
+    if index < 0:
+        raise ValueError(f"expected a non-negative frame index, got {value}")
+    return index
+
+
+def _print_traceback_if(debug: bool) -> None:
+    if debug:
+        import traceback
+
+        traceback.print_exc()
+
+
+def iter_frames(
+    kitti_dir: Path,
+    start_time_ns: Optional[int] = None,
+    frame_rate: float = 10.0,
+    calib_dir: Optional[Path] = None,
+    debug: bool = False,
+    frames: Optional[list] = None,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+    stride: int = 1,
+    max_frames: Optional[int] = None,
+) -> Iterator[KittiFrame]:
+    """
+    Lazily read and decode KITTI frames, one at a time.
+
+    Only the current frame's point cloud and image are held in memory, so callers can
+    stream a full drive into their own sinks without going through an MCAP file.
+
+    Args:
+        kitti_dir: Path to KITTI dataset directory
+        start_time_ns: Starting timestamp in nanoseconds (default: current time)
+        frame_rate: Frame rate used to space timestamps (default: 10 Hz)
+        calib_dir: Optional KITTI calibration directory for the camera -> velodyne TF
+        debug: Print tracebacks on per-frame failures
+        frames: Pre-computed output of `find_kitti_files` (default: scan `kitti_dir`)
+        start, end, stride, max_frames: Frame subset, see `select_frame_indices`.
+            Selection happens before any file is read; timestamps keep the spacing of
+            the full drive, and the static TF is stamped at the first selected frame.
+    """
+    if start_time_ns is None:
+        start_time_ns = int(time.time() * 1e9)
+    if frames is None:
+        frames = find_kitti_files(kitti_dir)
+
+    indices = select_frame_indices(len(frames), start, end, stride, max_frames)
+    time_step_ns = int(1e9 / frame_rate)
+    tf = None
+
+    for position, idx in enumerate(indices):
+        frame_id, lidar_file, image_file = frames[idx]
+        timestamp_ns = start_time_ns + (idx * time_step_ns)
+
+        points = None
+        try:
+            points = read_lidar_bin(lidar_file)
+        except Exception as e:
+            print(f"Warning: Failed to process LiDAR frame {frame_id}: {type(e).__name__}: {e}")
+            _print_traceback_if(debug)
+
+        image_jpeg = None
+        image_shape = None
+        try:
+            image = read_camera_image(image_file)
+            if image is None:
+                print(f"Warning: Failed to read image {image_file}")
+            else:
+                image_jpeg = encode_image_jpeg(image)
+                image_shape = image.shape
+        except Exception as e:
+            print(f"Warning: Failed to process camera frame {frame_id}: {type(e).__name__}: {e}")
+            _print_traceback_if(debug)
+
+        if tf is None:
+            tf = build_static_transforms(timestamp_ns, calib_dir)
+
+        yield KittiFrame(
+            index=idx,
+            position=position,
+            frame_id=frame_id,
+            timestamp_ns=timestamp_ns,
+            lidar_file=lidar_file,
+            image_file=image_file,
+            points=points,
+            image_jpeg=image_jpeg,
+            image_shape=image_shape,
+            tf=tf,
+        )
+
+
+def _frame_messages(
+    frame: KittiFrame, debug: bool = False, emit_tf: bool = False
+) -> Iterator[KittiMessage]:
+    """
+    Serialize one decoded frame into its LiDAR / camera messages, preceded by the
+    static TF when `emit_tf` is set (callers pass it for the first frame only).
+    """
+    if emit_tf:
+        tf_payload = frame.tf.SerializeToString()
+        if debug:
+            print(f"[debug] TF transforms={len(frame.tf.transforms)} serialized_bytes={len(tf_payload)}")
+        yield KittiMessage(TF_TOPIC, frame.timestamp_ns, tf_payload)
+
+    if frame.points is not None:
+        try:
+            payload = convert_pointcloud_to_proto(frame.points, frame.timestamp_ns).SerializeToString()
+        except Exception as e:
+            print(f"Warning: Failed to process LiDAR frame {frame.frame_id}: {type(e).__name__}: {e}")
+            _print_traceback_if(debug)
+        else:
+            if debug and frame.position < 3:
+                print(
+                    f"[debug] LiDAR frame={frame.frame_id} points={frame.points.shape[0]} "
+                    f"bin={frame.lidar_file.name} serialized_bytes={len(payload)}"
+                )
+            yield KittiMessage(LIDAR_TOPIC, frame.timestamp_ns, payload)
+
+    if frame.image_jpeg is not None:
+        try:
+            payload = convert_jpeg_to_proto(frame.image_jpeg, frame.timestamp_ns).SerializeToString()
+        except Exception as e:
+            print(f"Warning: Failed to process camera frame {frame.frame_id}: {type(e).__name__}: {e}")
+            _print_traceback_if(debug)
+        else:
+            if debug and frame.position < 3:
+                print(
+                    f"[debug] Camera frame={frame.frame_id} shape={frame.image_shape} "
+                    f"png={frame.image_file.name} jpeg_bytes={len(frame.image_jpeg)} "
+                    f"serialized_bytes={len(payload)}"
+                )
+            yield KittiMessage(CAMERA_TOPIC, frame.timestamp_ns, payload)
+
+
+def iter_messages(
+    kitti_dir: Path,
+    start_time_ns: Optional[int] = None,
+    frame_rate: float = 10.0,
+    calib_dir: Optional[Path] = None,
+    debug: bool = False,
+    frames: Optional[list] = None,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+    stride: int = 1,
+    max_frames: Optional[int] = None,
+) -> Iterator[KittiMessage]:
+    """
+    Lazily yield serialized Foxglove protobuf messages, in log-time order.
+
+    The static TF is emitted once before the first frame's sensor messages. Message
+    types per topic are listed in `TOPIC_SCHEMAS`. Arguments match `iter_frames`.
+    """
+    emit_tf = True
+    for frame in iter_frames(
+        kitti_dir,
+        start_time_ns=start_time_ns,
+        frame_rate=frame_rate,
+        calib_dir=calib_dir,
+        debug=debug,
+        frames=frames,
+        start=start,
+        end=end,
+        stride=stride,
+        max_frames=max_frames,
+    ):
+        yield from _frame_messages(frame, debug=debug, emit_tf=emit_tf)
+        emit_tf = False
+
+
+def _register_channels(writer: Writer) -> dict[str, int]:
+    """
+    Register one protobuf schema + channel per topic in `TOPIC_SCHEMAS`.
+    Returns topic -> channel id.
+    """
+    channel_ids = {}
+    for topic, message_type in TOPIC_SCHEMAS.items():
+        # Use descriptor-derived names + a FileDescriptorSet payload
+        schema_id = writer.register_schema(
+            name=message_type.DESCRIPTOR.full_name,
+            encoding="protobuf",
+            data=_build_file_descriptor_set_bytes(message_type.DESCRIPTOR),
+        )
+        channel_ids[topic] = writer.register_channel(
+            schema_id=schema_id,
+            topic=topic,
+            message_encoding="protobuf",
+        )
+    return channel_ids
+
+
 def convert_kitti_to_mcap(
     kitti_dir: Path,
     output_path: Path,
@@ -289,6 +630,10 @@ def convert_kitti_to_mcap(
     frame_rate: float = 10.0,
     debug: bool = False,
     calib_dir: Optional[Path] = None,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+    stride: int = 1,
+    max_frames: Optional[int] = None,
 ):
     """
     Convert KITTI dataset to MCAP format.
@@ -298,190 +643,74 @@ def convert_kitti_to_mcap(
         output_path: Path to output MCAP file
         start_time_ns: Starting timestamp in nanoseconds (default: current time)
         frame_rate: Frame rate for playback (default: 10 Hz)
+        start, end, stride, max_frames: Optional frame subset, see `select_frame_indices`
     """
-    import time
-    
-    if start_time_ns is None:
-        start_time_ns = int(time.time() * 1e9)
-    
+    # Split wall time into fixed costs (index scan, writer setup/finish) and per-frame
+    # costs, so a subset run can estimate what the full drive would have taken.
+    t_start = time.perf_counter()
     frames = find_kitti_files(kitti_dir)
     
     if len(frames) == 0:
         raise ValueError("No matching LiDAR and camera frames found!")
     
-    print(f"Found {len(frames)} frames to convert")
-    
-    # Calculate time step per frame
-    time_step_ns = int(1e9 / frame_rate)
+    num_selected = len(select_frame_indices(len(frames), start, end, stride, max_frames))
+    if num_selected == 0:
+        raise ValueError(
+            f"Frame selection (start={start} end={end} stride={stride} max_frames={max_frames}) "
+            f"matches none of the {len(frames)} frames"
+        )
+
+    if num_selected == len(frames):
+        print(f"Found {len(frames)} frames to convert")
+    else:
+        print(f"Found {len(frames)} frames, converting {num_selected} selected frames")
     
     # Open MCAP writer
     with open(output_path, "wb") as f:
         writer = Writer(f)
         writer.start()
-        
-        # Register schemas (use descriptor-derived names + a FileDescriptorSet payload)
-        pointcloud_schema = writer.register_schema(
-            name=PointCloud.DESCRIPTOR.full_name,
-            encoding="protobuf",
-            data=_build_file_descriptor_set_bytes(PointCloud.DESCRIPTOR),
-        )
-        
-        image_schema = writer.register_schema(
-            name=CompressedImage.DESCRIPTOR.full_name,
-            encoding="protobuf",
-            data=_build_file_descriptor_set_bytes(CompressedImage.DESCRIPTOR),
-        )
-        
-        # Register channels
-        lidar_channel = writer.register_channel(
-            schema_id=pointcloud_schema,
-            topic="/velodyne_points",
-            message_encoding="protobuf",
-        )
-        
-        camera_channel = writer.register_channel(
-            schema_id=image_schema,
-            topic="/camera/image_raw",
-            message_encoding="protobuf",
-        )
-
-        # TF / transforms
-        tf_schema = writer.register_schema(
-            name=FrameTransforms.DESCRIPTOR.full_name,
-            encoding="protobuf",
-            data=_build_file_descriptor_set_bytes(FrameTransforms.DESCRIPTOR),
-        )
-        tf_channel = writer.register_channel(
-            schema_id=tf_schema,
-            topic="/tf",
-            message_encoding="protobuf",
-        )
-
-        # Publish static transforms (once at start)
-        tf_msg = FrameTransforms()
-
-        # map -> camera (identity) so Studio has a stable root frame
-        t_map_cam = tf_msg.transforms.add()
-        t_map_cam.timestamp.FromNanoseconds(start_time_ns)
-        t_map_cam.parent_frame_id = "map"
-        t_map_cam.child_frame_id = "camera"
-        t_map_cam.translation.x = 0.0
-        t_map_cam.translation.y = 0.0
-        t_map_cam.translation.z = 0.0
-        t_map_cam.rotation.x = 0.0
-        t_map_cam.rotation.y = 0.0
-        t_map_cam.rotation.z = 0.0
-        t_map_cam.rotation.w = 1.0
-
-        # camera -> velodyne from KITTI calibration (optional but recommended)
-        if calib_dir is not None:
-            velo_to_cam_path = calib_dir / "calib_velo_to_cam.txt"
-            if velo_to_cam_path.exists():
-                R, T = _parse_kitti_r_t_calib(velo_to_cam_path)
-                qx, qy, qz, qw = _rotation_matrix_to_quaternion_xyzw(R)
-
-                # KITTI gives: p_cam = R * p_velo + T
-                # This matches a TF transform with parent=camera, child=velodyne.
-                t_cam_velo = tf_msg.transforms.add()
-                t_cam_velo.timestamp.FromNanoseconds(start_time_ns)
-                t_cam_velo.parent_frame_id = "camera"
-                t_cam_velo.child_frame_id = "velodyne"
-                t_cam_velo.translation.x = float(T[0])
-                t_cam_velo.translation.y = float(T[1])
-                t_cam_velo.translation.z = float(T[2])
-                t_cam_velo.rotation.x = qx
-                t_cam_velo.rotation.y = qy
-                t_cam_velo.rotation.z = qz
-                t_cam_velo.rotation.w = qw
-            else:
-                print(f"Warning: calib_velo_to_cam.txt not found in calib_dir: {calib_dir}")
-
-        tf_payload = tf_msg.SerializeToString()
-        if debug:
-            print(f"[debug] TF transforms={len(tf_msg.transforms)} serialized_bytes={len(tf_payload)}")
-
-        writer.add_message(
-            channel_id=tf_channel,
-            log_time=start_time_ns,
-            data=tf_payload,
-            publish_time=start_time_ns,
-        )
-        
-        # Write messages
-        lidar_ok = 0
-        camera_ok = 0
-        lidar_fail = 0
-        camera_fail = 0
-
-        for idx, (frame_id, lidar_file, image_file) in enumerate(frames):
-            timestamp_ns = start_time_ns + (idx * time_step_ns)
-            
-            # Convert and write LiDAR
-            try:
-                points = read_lidar_bin(lidar_file)
-                pointcloud = convert_pointcloud_to_proto(points, timestamp_ns)
-                payload = pointcloud.SerializeToString()
-                if debug and idx < 3:
-                    print(
-                        f"[debug] LiDAR frame={frame_id} points={points.shape[0]} "
-                        f"bin={lidar_file.name} serialized_bytes={len(payload)}"
-                    )
-                writer.add_message(
-                    channel_id=lidar_channel,
-                    log_time=timestamp_ns,
-                    data=payload,
-                    publish_time=timestamp_ns,
-                )
-                lidar_ok += 1
-            except Exception as e:
-                lidar_fail += 1
-                print(f"Warning: Failed to process LiDAR frame {frame_id}: {type(e).__name__}: {e}")
-                if debug:
-                    import traceback
-
-                    traceback.print_exc()
-            
-            # Convert and write camera
-            try:
-                image = read_camera_image(image_file)
-                if image is None:
-                    print(f"Warning: Failed to read image {image_file}")
-                    camera_fail += 1
-                    continue
-                
-                compressed_image = convert_image_to_proto(image, timestamp_ns)
-                payload = compressed_image.SerializeToString()
-                if debug and idx < 3:
-                    print(
-                        f"[debug] Camera frame={frame_id} shape={image.shape} "
-                        f"png={image_file.name} jpeg_bytes={len(compressed_image.data)} serialized_bytes={len(payload)}"
-                    )
+        channel_ids = _register_channels(writer)
+        written = {topic: 0 for topic in channel_ids}
+        frame_count = 0
+        t_frames_start = time.perf_counter()
+
+        for frame in iter_frames(
+            kitti_dir,
+            start_time_ns=start_time_ns,
+            frame_rate=frame_rate,
+            calib_dir=calib_dir,
+            debug=debug,
+            frames=frames,
+            start=start,
+            end=end,
+            stride=stride,
+            max_frames=max_frames,
+        ):
+            for msg in _frame_messages(frame, debug=debug, emit_tf=frame_count == 0):
                 writer.add_message(
-                    channel_id=camera_channel,
-                    log_time=timestamp_ns,
-                    data=payload,
-                    publish_time=timestamp_ns,
+                    channel_id=channel_ids[msg.topic],
+                    log_time=msg.log_time_ns,
+                    data=msg.data,
+                    publish_time=msg.log_time_ns,
                 )
-                camera_ok += 1
-            except Exception as e:
-                camera_fail += 1
-                print(f"Warning: Failed to process camera frame {frame_id}: {type(e).__name__}: {e}")
-                if debug:
-                    import traceback
-
-                    traceback.print_exc()
-            
-            if (idx + 1) % 10 == 0:
-                print(f"Processed {idx + 1}/{len(frames)} frames...")
+                written[msg.topic] += 1
+
+            frame_count += 1
+            if frame_count % 10 == 0:
+                print(f"Processed {frame_count}/{num_selected} frames...")
         
+        t_frames_end = time.perf_counter()
         writer.finish()
         # Ensure bytes are flushed to disk
         f.flush()
         os.fsync(f.fileno())
+        t_end = time.perf_counter()
 
+        lidar_ok = written[LIDAR_TOPIC]
+        camera_ok = written[CAMERA_TOPIC]
         print(
-            f"Write summary: lidar_ok={lidar_ok} lidar_fail={lidar_fail} "
-            f"camera_ok={camera_ok} camera_fail={camera_fail}"
+            f"Write summary: lidar_ok={lidar_ok} lidar_fail={frame_count - lidar_ok} "
+            f"camera_ok={camera_ok} camera_fail={frame_count - camera_ok}"
         )
 
         if lidar_ok == 0 and camera_ok == 0:
@@ -491,6 +720,24 @@ def convert_kitti_to_mcap(
 
         print(f"Successfully wrote MCAP to {output_path}")
 
+        if num_selected < len(frames):
+            elapsed = t_end - t_start
+            frames_s = t_frames_end - t_frames_start
+            fixed_s = elapsed - frames_s
+            # Only the per-frame part scales with the drive length. This is an
+            # extrapolation from the measured frames, not a timed full conversion.
+            full_estimate = fixed_s + frames_s * len(frames) / num_selected
+            print(
+                f"Converted {num_selected}/{len(frames)} frames "
+                f"({100.0 * num_selected / len(frames):.1f}% of the drive) in {elapsed:.2f}s "
+                f"(fixed {fixed_s:.2f}s + frames {frames_s:.2f}s)"
+            )
+            if elapsed > 0:
+                print(
+                    f"Estimated full conversion: {full_estimate:.2f}s "
+                    f"(~{full_estimate / elapsed:.1f}x estimated speedup, extrapolated from per-frame time)"
+                )
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -520,6 +767,30 @@ def main():
         default=None,
         help="Path to KITTI calibration directory (e.g., .../2011_09_26/ containing calib_velo_to_cam.txt, etc.)",
     )
+    parser.add_argument(
+        "--start",
+        type=str,
+        default=None,
+        help="First frame to convert: a frame index (e.g. 100) or seconds with an 's' suffix (e.g. 10s)",
+    )
+    parser.add_argument(
+        "--end",
+        type=str,
+        default=None,
+        help="Stop before this frame: a frame index or seconds with an 's' suffix (exclusive)",
+    )
+    parser.add_argument(
+        "--stride",
+        type=int,
+        default=1,
+        help="Convert every Nth frame (default: 1)",
+    )
+    parser.add_argument(
+        "--max_frames",
+        type=int,
+        default=None,
+        help="Maximum number of frames to convert, applied after --start/--end/--stride",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -528,6 +799,16 @@ def main():
     
     args = parser.parse_args()
     
+    try:
+        start = _parse_frame_bound(args.start, args.frame_rate) if args.start is not None else None
+        end = _parse_frame_bound(args.end, args.frame_rate) if args.end is not None else None
+    except ValueError as e:
+        parser.error(f"invalid --start/--end: {e}")
+    if args.stride < 1:
+        parser.error("--stride must be >= 1")
+    if args.max_frames is not None and args.max_frames < 1:
+        parser.error("--max_frames must be >= 1")
+
     kitti_dir = Path(args.kitti_dir)
     output_path = Path(args.output)
     calib_dir = Path(args.calib_dir) if args.calib_dir else None
@@ -543,6 +824,10 @@ def main():
             frame_rate=args.frame_rate,
             debug=args.debug,
             calib_dir=calib_dir,
+            start=start,
+            end=end,
+            stride=args.stride,
+            max_frames=args.max_frames,
         )
         print(f"\n✓ Conversion complete! Open {output_path} in Foxglove Studio")
         return 0